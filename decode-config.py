@@ -139,6 +139,7 @@ import platform
 try:
     from datetime import datetime, timezone
     import base64
+    import bisect
     import time
     import copy
     import struct
@@ -280,6 +281,25 @@ EXIT_CODE = 0
 # 'groupmapping'     map - grouped configuration data (filtered by possible functions)
 CONFIG = {}
 
+# precompiled struct.Struct objects by format specifier (see get_struct())
+STRUCTS = {}
+# format prefix counts by format specifier (see get_formatcount())
+FORMATCOUNTS = {}
+# format types and bitsizes by format specifier (see get_formattype())
+FORMATTYPES = {}
+# compiled evaluable strings (see compile_macros())
+MACRO_CODES = {}
+# compiled validate strings or (min, max) ranges (see validate_value())
+VALIDATE_CODES = {}
+# parsed field definitions (see get_fielddef())
+FIELDDEFS = {}
+# field definition item names by fields string (see get_fielddef())
+FIELDNAMES = {}
+# subfield definitions (see get_subfielddef())
+SUBFIELDDEFS = {}
+# string indexes by SETTINGVAR string list (see get_strindex())
+STRINDEXES = {}
+
 # ======================================================================
 # Settings mapping
 # ======================================================================
@@ -462,6 +482,18 @@ def passwordwrite(value):
     """
     return None if value == HIDDEN_PASSWORD else value
 
+def ipv4read(value):
+    """
+    IPv4 address read helper
+    """
+    return socket.inet_ntoa(get_struct('<L').pack(value))
+
+def ipv4write(value):
+    """
+    IPv4 address write helper
+    """
+    return get_struct('<L').unpack(socket.inet_aton(value))[0]
+
 def scriptread(value):
     """
     Scripter config helper to read script
@@ -649,6 +681,9 @@ class Hardware:
     # Tasmota config_version values
     config_versions = (ESP82, ESP32ex, ESP32S3, ESP32S2, ESP32C3, ESP32C2, ESP32C6)
 
+    # dict index strings based on hardware
+    hstrs = {hw[0]: 'TEXTINDEX_'+hw[1] for hw in config}
+
     def get_bitmask(self, config_version):
         """
         Get hardware bitmask based on Tasmota config_version
@@ -669,7 +704,7 @@ class Hardware:
             dict index string
         """
         try:
-            return 'TEXTINDEX_'+self.config[[hw[0] for hw in self.config].index(setting_hardware)][1]
+            return self.hstrs[setting_hardware]
         except:     # pylint: disable=bare-except
             return 'TEXTINDEX_'+self.config[len(self.config)-1][1]
 
@@ -706,6 +741,47 @@ class Hardware:
 
 HARDWARE = Hardware()
 
+# SETTINGVAR dict index strings
+HSTR_ESP = HARDWARE.hstr(HARDWARE.ESP)
+HSTR_ESP82 = HARDWARE.hstr(HARDWARE.ESP82)
+HSTR_ESP32 = HARDWARE.hstr(HARDWARE.ESP32)
+
+def setting_copy(setting, memo=None):
+    """
+    Create a copy of a setting definition
+
+    Only the mutable parts of a setting (dicts, lists and the field
+    tuples holding a sub-setting dict) are copied, the immutable field
+    definition tuples are shared with the source setting
+
+    @param setting:
+        setting definition dict
+    @param memo:
+        dict of already copied objects (by id)
+
+    @return:
+        copy of setting
+    """
+    if memo is None:
+        memo = {}
+    if id(setting) in memo:
+        return memo[id(setting)]
+
+    if isinstance(setting, dict):
+        copy_ = {}
+        memo[id(setting)] = copy_
+        for key, value in setting.items():
+            copy_[key] = setting_copy(value, memo)
+    elif isinstance(setting, list):
+        copy_ = list(setting)
+    elif isinstance(setting, tuple) and len(setting) > 1 and isinstance(setting[1], dict):
+        copy_ = (setting[0], setting_copy(setting[1], memo)) + setting[2:]
+    else:
+        return setting
+    memo[id(setting)] = copy_
+
+    return copy_
+
 # pylint: disable=bad-continuation,bad-whitespace
 SETTING_5_10_0 = {
                                    # <hardware>, <format>, <addrdef>,    <datadef>                                                      [,<converter>]
@@ -829,7 +905,7 @@ SETTING_5_10_0 = {
     'ntp_server':                   (HARDWARE.ESP,   '33s', 0x4CE,       ([3],  None,                           ('Wifi',        '"NtpServer{} {}".format(#+1,$)')) ),
     'ina219_mode':                  (HARDWARE.ESP,   'B',   0x531,       (None, '0 <= $ <= 7',                  ('Sensor',      '"Sensor13 {}".format($)')) ),
     'pulse_timer':                  (HARDWARE.ESP,   '<H',  0x532,       ([8],  '0 <= $ <= 64900',              ('Control',     '"PulseTime{} {}".format(#+1,$)')) ),
-    'ip_address':                   (HARDWARE.ESP,   '<L',  0x544,       ([4],  None,                           ('Wifi',        '"IPAddress{} {}".format(#+1,$)')), ("socket.inet_ntoa(struct.pack('<L', $))", "struct.unpack('<L', socket.inet_aton($))[0]")),
+    'ip_address':                   (HARDWARE.ESP,   '<L',  0x544,       ([4],  None,                           ('Wifi',        '"IPAddress{} {}".format(#+1,$)')), (ipv4read, ipv4write)),
     'energy_kWhtotal':              (HARDWARE.ESP,   '<L',  0x554,       (None, '0 <= $ <= 4250000000',         ('Power',       '"EnergyReset3 {}".format(int(round(float($)//100)))')) ),
     'mqtt_fulltopic':               (HARDWARE.ESP,   '100s',0x558,       (None, None,                           ('MQTT',        '"FullTopic {}".format($)')) ),
     'flag2':                        (HARDWARE.ESP, {
@@ -1250,7 +1326,7 @@ SETTING_6_6_0_3['flag3'][1].update  ({
 # ======================================================================
 SETTING_6_6_0_5 = copy.copy(SETTING_6_6_0_3)
 SETTING_6_6_0_5.update              ({
-    'sensors':                      (HARDWARE.ESP,   '<L',  0x7A4,       ([3],  None,                           ('Wifi',        'list("WebSensor{} {}".format((#*32)+i, 1 if (int($,0) & (1<<i)) else 0) for i in range(0, 32))')), '"0x{:08x}".format($)' ),
+    'sensors':                      (HARDWARE.ESP,   '<L',  0x7A4,       ([3],  None,                           ('Wifi',        '["WebSensor{} {}".format((#*32)+i, 1 if (int($,0) & (1<<i)) else 0) for i in range(0, 32)]')), '"0x{:08x}".format($)' ),
                                     })
 SETTING_6_6_0_5['flag3'][1].update  ({
         'tuya_dimmer_min_limit':    (HARDWARE.ESP,   '<L', (0x3A0,1,19), (None, None,                           ('SetOption',   '"SetOption69 {}".format($)')) ),
@@ -1338,7 +1414,7 @@ SETTING_6_6_0_14.update             ({
     'shutter_accuracy':             (HARDWARE.ESP,   'B',   0x1E6,       (None, None,                           ('Shutter',     None)) ),
     'shutter_opentime':             (HARDWARE.ESP,   '<H',  0xE40,       ([4],  None,                           ('Shutter',     '"ShutterOpenDuration{} {:.1f}".format(#+1,float($)/10.0)')) ),
     'shutter_closetime':            (HARDWARE.ESP,   '<H',  0xE48,       ([4],  None,                           ('Shutter',     '"ShutterCloseDuration{} {:.1f}".format(#+1,float($)/10.0)')) ),
-    'shuttercoeff':                 (HARDWARE.ESP,   '<H',  0xE50,       ([5,4],None,                           ('Shutter',     'list("ShutterCalibration{} {}".format(k+1, list(",".join(str(@["shuttercoeff"][i][j]) for i in range(0, len(@["shuttercoeff"]))) for j in range(0, len(@["shuttercoeff"][0])))[k]) for k in range(0,len(@["shuttercoeff"][0])))')) ),
+    'shuttercoeff':                 (HARDWARE.ESP,   '<H',  0xE50,       ([5,4],None,                           ('Shutter',     '["ShutterCalibration{} {}".format(k+1, [",".join(str(@["shuttercoeff"][i][j]) for i in range(0, len(@["shuttercoeff"]))) for j in range(0, len(@["shuttercoeff"][0]))][k]) for k in range(0,len(@["shuttercoeff"][0]))]')) ),
     'shutter_invert':               (HARDWARE.ESP,   'B',   0xE78,       ([4],  None,                           ('Shutter',     '"ShutterInvert{} {}".format(#+1,$)')) ),
     'shutter_set50percent':         (HARDWARE.ESP,   'B',   0xE7C,       ([4],  None,                           ('Shutter',     '"ShutterSetHalfway{} {}".format(#+1,$)')) ),
     'shutter_position':             (HARDWARE.ESP,   'B',   0xE80,       ([4],  None,                           ('Shutter',     '"ShutterPosition{} {}".format(#+1,$)')) ),
@@ -1400,7 +1476,7 @@ SETTING_7_0_0_2.update              ({
 # ======================================================================
 SETTING_7_0_0_3 = copy.copy(SETTING_7_0_0_2)
 SETTING_7_0_0_3.update              ({
-    'i2c_drivers':                  (HARDWARE.ESP,   '<L',  0xFEC,       ([3],  None,                           ('Management',  'list("I2CDriver{} {}".format((#*32)+i, 1 if (int($,0) & (1<<i)) else 0) for i in range(0, 32))')),'"0x{:08x}".format($)' ),
+    'i2c_drivers':                  (HARDWARE.ESP,   '<L',  0xFEC,       ([3],  None,                           ('Management',  '["I2CDriver{} {}".format((#*32)+i, 1 if (int($,0) & (1<<i)) else 0) for i in range(0, 32)]')),'"0x{:08x}".format($)' ),
                                     })
 # ======================================================================
 SETTING_7_0_0_4 = copy.copy(SETTING_7_0_0_3)
@@ -1471,7 +1547,7 @@ SETTING_8_0_0_1.update              ({
     # v8.x.x.x: Index numbers for indexed strings
     SETTINGVAR:
     {
-        HARDWARE.hstr(HARDWARE.ESP):
+        HSTR_ESP:
                        ['SET_OTAURL',
                         'SET_MQTTPREFIX1', 'SET_MQTTPREFIX2', 'SET_MQTTPREFIX3',
                         'SET_STASSID1', 'SET_STASSID2',
@@ -1493,8 +1569,8 @@ SETTING_8_0_0_1.update              ({
                         'SET_MAX']
     }
                                     })
-SETTING_8_0_0_1[SETTINGVAR].update({HARDWARE.hstr(HARDWARE.ESP82): copy.copy(SETTING_8_0_0_1[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)])})
-SETTING_8_0_0_1[SETTINGVAR].update({HARDWARE.hstr(HARDWARE.ESP32): copy.copy(SETTING_8_0_0_1[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)])})
+SETTING_8_0_0_1[SETTINGVAR].update({HSTR_ESP82: copy.copy(SETTING_8_0_0_1[SETTINGVAR][HSTR_ESP])})
+SETTING_8_0_0_1[SETTINGVAR].update({HSTR_ESP32: copy.copy(SETTING_8_0_0_1[SETTINGVAR][HSTR_ESP])})
 SETTING_8_0_0_1.update              ({
     'ota_url':                      (HARDWARE.ESP,   '699s',(0x017,'SET_OTAURL'),
                                                                          (None, None,                           ('Management',  '"OtaUrl {}".format($)')) ),
@@ -1560,6 +1636,8 @@ SETTING_8_1_0_2.update              ({
     'shutter_button':               (HARDWARE.ESP,   '<L',  0xFDC,       ([4],  None,                           ('Shutter',     '"ShutterButton{} {a} {b} {c} {d} {e} {f} {g} {h} {i} {j}".format(#+1, a=(($>> 0)&(0x03))+1, b=((($>> 2)&(0x3f))-1)<<1, c=((($>> 8)&(0x3f))-1)<<1, d=((($>>14)&(0x3f))-1)<<1, e=((($>>20)&(0x3f))-1)<<1, f=($>>26)&(0x01), g=($>>27)&(0x01),  h=($>>28)&(0x01), i=($>>29)&(0x01), j=($>>30)&(0x01) ) if $!=0 else "ShutterButton{} {}".format(#+1,0)')),'"0x{:08x}".format($)' ),
                                     })
 # ======================================================================
+# read/write converter shared by shutter_button press_* fields
+SHUTTER_PRESS_CONVERTER = ('"-" if $==0 else ($-1)<<1','0 if $=="-" else (int(str($),0)>>1)+1')
 SETTING_8_1_0_3 = copy.copy(SETTING_8_1_0_2)
 SETTING_8_1_0_3.pop('shutter_invert',None)
 SETTING_8_1_0_3.update              ({
@@ -1580,10 +1658,10 @@ SETTING_8_1_0_3.update              ({
                                                                                                                                     i=@["shutter_button"][#]["mqtt_broadcast_hold"], \
                                                                                                                                     j=@["shutter_button"][#]["mqtt_broadcast_all"] \
                                                                                                                                 )')), ('$+1','$-1') ),
-        'press_single':             (HARDWARE.ESP,   '<L', (0xFDC,6, 2), (None, None,                           ('Shutter',     None)), ('"-" if $==0 else ($-1)<<1','0 if $=="-" else (int(str($),0)>>1)+1') ),
-        'press_double':             (HARDWARE.ESP,   '<L', (0xFDC,6, 8), (None, None,                           ('Shutter',     None)), ('"-" if $==0 else ($-1)<<1','0 if $=="-" else (int(str($),0)>>1)+1') ),
-        'press_triple':             (HARDWARE.ESP,   '<L', (0xFDC,6,14), (None, None,                           ('Shutter',     None)), ('"-" if $==0 else ($-1)<<1','0 if $=="-" else (int(str($),0)>>1)+1') ),
-        'press_hold':               (HARDWARE.ESP,   '<L', (0xFDC,6,20), (None, None,                           ('Shutter',     None)), ('"-" if $==0 else ($-1)<<1','0 if $=="-" else (int(str($),0)>>1)+1') ),
+        'press_single':             (HARDWARE.ESP,   '<L', (0xFDC,6, 2), (None, None,                           ('Shutter',     None)), SHUTTER_PRESS_CONVERTER ),
+        'press_double':             (HARDWARE.ESP,   '<L', (0xFDC,6, 8), (None, None,                           ('Shutter',     None)), SHUTTER_PRESS_CONVERTER ),
+        'press_triple':             (HARDWARE.ESP,   '<L', (0xFDC,6,14), (None, None,                           ('Shutter',     None)), SHUTTER_PRESS_CONVERTER ),
+        'press_hold':               (HARDWARE.ESP,   '<L', (0xFDC,6,20), (None, None,                           ('Shutter',     None)), SHUTTER_PRESS_CONVERTER ),
         'mqtt_broadcast_single':    (HARDWARE.ESP,   '<L', (0xFDC,1,26), (None, None,                           ('Shutter',     None)) ),
         'mqtt_broadcast_double':    (HARDWARE.ESP,   '<L', (0xFDC,1,27), (None, None,                           ('Shutter',     None)) ),
         'mqtt_broadcast_triple':    (HARDWARE.ESP,   '<L', (0xFDC,1,28), (None, None,                           ('Shutter',     None)) ),
@@ -1626,11 +1704,9 @@ SETTING_8_1_0_6.update              ({
                                     })
 # ======================================================================
 SETTING_8_1_0_9 = copy.copy(SETTING_8_1_0_6)
-SETTING_8_1_0_9[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)].pop()  # SET_MAX
-SETTING_8_1_0_9[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)].extend(['SET_MQTT_GRP_TOPIC2', 'SET_MQTT_GRP_TOPIC3', 'SET_MQTT_GRP_TOPIC4'])
-SETTING_8_1_0_9[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)].extend(['SET_MAX'])
-SETTING_8_1_0_9[SETTINGVAR].update({HARDWARE.hstr(HARDWARE.ESP82): copy.copy(SETTING_8_1_0_9[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)])})
-SETTING_8_1_0_9[SETTINGVAR].update({HARDWARE.hstr(HARDWARE.ESP32): copy.copy(SETTING_8_1_0_9[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)])})
+SETTING_8_1_0_9[SETTINGVAR][HSTR_ESP][-1:-1] = ['SET_MQTT_GRP_TOPIC2', 'SET_MQTT_GRP_TOPIC3', 'SET_MQTT_GRP_TOPIC4']  # insert before SET_MAX
+SETTING_8_1_0_9[SETTINGVAR].update({HSTR_ESP82: copy.copy(SETTING_8_1_0_9[SETTINGVAR][HSTR_ESP])})
+SETTING_8_1_0_9[SETTINGVAR].update({HSTR_ESP32: copy.copy(SETTING_8_1_0_9[SETTINGVAR][HSTR_ESP])})
 SETTING_8_1_0_9.update              ({
     'device_group_share_in':        (HARDWARE.ESP,   '<L',  0xFCC,       (None, None,                           ('Control',     '"DevGroupShare 0x{:08x},0x{:08x}".format(@["device_group_share_in"],@["device_group_share_out"])')) ),
     'device_group_share_out':       (HARDWARE.ESP,   '<L',  0xFD0,       (None, None,                           ('Control',     None)) ),
@@ -1671,11 +1747,9 @@ SETTING_8_2_0_0.update              ({
                                     })
 # ======================================================================
 SETTING_8_2_0_3 = copy.copy(SETTING_8_2_0_0)
-SETTING_8_2_0_3[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)].pop()  # SET_MAX
-SETTING_8_2_0_3[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)].extend(['SET_TEMPLATE_NAME', 'SET_DEV_GROUP_NAME1', 'SET_DEV_GROUP_NAME2', 'SET_DEV_GROUP_NAME3', 'SET_DEV_GROUP_NAME4'])
-SETTING_8_2_0_3[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)].extend(['SET_MAX'])
-SETTING_8_2_0_3[SETTINGVAR].update({HARDWARE.hstr(HARDWARE.ESP82): copy.copy(SETTING_8_2_0_3[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)])})
-SETTING_8_2_0_3[SETTINGVAR].update({HARDWARE.hstr(HARDWARE.ESP32): copy.copy(SETTING_8_2_0_3[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)])})
+SETTING_8_2_0_3[SETTINGVAR][HSTR_ESP][-1:-1] = ['SET_TEMPLATE_NAME', 'SET_DEV_GROUP_NAME1', 'SET_DEV_GROUP_NAME2', 'SET_DEV_GROUP_NAME3', 'SET_DEV_GROUP_NAME4']  # insert before SET_MAX
+SETTING_8_2_0_3[SETTINGVAR].update({HSTR_ESP82: copy.copy(SETTING_8_2_0_3[SETTINGVAR][HSTR_ESP])})
+SETTING_8_2_0_3[SETTINGVAR].update({HSTR_ESP32: copy.copy(SETTING_8_2_0_3[SETTINGVAR][HSTR_ESP])})
 SETTING_8_2_0_3.pop('mqtt_grptopicdev',None)
 SETTING_8_2_0_3.update              ({
     'templatename':                 (HARDWARE.ESP,   '699s',(0x017,'SET_TEMPLATE_NAME'),
@@ -1743,8 +1817,6 @@ SETTING_8_2_0_3['SensorBits1'][1].update({
 SETTING_8_2_0_4 = copy.copy(SETTING_8_2_0_3)
 SETTING_8_2_0_4.update              ({
     'config_version':               (HARDWARE.ESP,   'B',   0xF36,       (None, '0 <= $ < len(HARDWARE.config_versions)',   (INTERNAL,      None)), (None,      False) ),
-                                    })
-SETTING_8_2_0_4.update              ({
     'param':                        (HARDWARE.ESP,   'B',   0x2FC,       ([18], None,                           ('SetOption',   '"SO{} {}".format(#+32,$)')) ),
                                     })
 SETTING_8_2_0_4['flag'][1].update   ({
@@ -1826,7 +1898,7 @@ SETTING_8_2_0_6.pop('tariff1_1', None)
 SETTING_8_2_0_6.pop('tariff2_0', None)
 SETTING_8_2_0_6.pop('tariff2_1', None)
 SETTING_8_2_0_6.update              ({
-    'tariff':                       (HARDWARE.ESP,   '<H',  0xE30,       ([4,2],None,                           ('Power',       'list("Tariff{} {:02d}:{:02d},{:02d}:{:02d}".format(i+1, @["tariff"][i][0]//60, @["tariff"][i][0]%60, @["tariff"][i][1]//60, @["tariff"][i][1]%60) for i in range(0, len(@["tariff"][0])))')) ),
+    'tariff':                       (HARDWARE.ESP,   '<H',  0xE30,       ([4,2],None,                           ('Power',       '["Tariff{} {:02d}:{:02d},{:02d}:{:02d}".format(i+1, @["tariff"][i][0]//60, @["tariff"][i][0]%60, @["tariff"][i][1]//60, @["tariff"][i][1]%60) for i in range(0, len(@["tariff"][0]))]')) ),
     'my_gp_esp32':                  (HARDWARE.ESP32, '<H',  0x3AC,       ([40], None,                           ('Management',  '"Gpio{} {}".format(#, $)')) ),
     'user_template_esp32':          (HARDWARE.ESP32,{
         'base':                     (HARDWARE.ESP32, '<H',  0x71F,       (None, None,                           ('Management',  '"Template {{\\\"BASE\\\":{}}}".format($)')), ('$+1','$-1') ),
@@ -1851,7 +1923,7 @@ SETTING_8_2_0_6.update              ({
     'ot_hot_water_setpoint':        (HARDWARE.ESP,   'B',   0xE8C,       (None, None,                           ('Sensor',      '"Backlog OT_TWater {};OT_Save_Setpoints".format($)')) ),
     'ot_boiler_setpoint':           (HARDWARE.ESP,   'B',   0xE8D,       (None, None,                           ('Sensor',      '"Backlog OT_TBoiler {};OT_Save_Setpoints".format($)')) ),
     'ot_flags':                     (HARDWARE.ESP,   'B',   0xE8E,       (None, None,                           ('Sensor',      '"OT_Flags {}".format(",".join(["CHOD","DHW","CH","COOL","OTC","CH2"][i] for i in range(0,6) if $ & 1<<i))')) ),
-    'rules':                        (HARDWARE.ESP,   '512s',0x800,       ([3],  None,                           ('Rules',       '"Rule{} \\"".format(#+1) if len($) == 0 else list("Rule{} {}{}".format(#+1, "+" if i else "", s) for i, s in enumerate(textwrap.wrap($, width=512))) if ARGS.cmnduseruleconcat else "Rule{} {}".format(#+1,$)')) ),
+    'rules':                        (HARDWARE.ESP,   '512s',0x800,       ([3],  None,                           ('Rules',       '"Rule{} \\"".format(#+1) if len($) == 0 else ["Rule{} {}{}".format(#+1, "+" if i else "", s) for i, s in enumerate(textwrap.wrap($, width=512))] if ARGS.cmnduseruleconcat else "Rule{} {}".format(#+1,$)')) ),
                                     })
 SETTING_8_2_0_6['flag4'][1].update  ({
         'compress_rules_cpu':       (HARDWARE.ESP,   '<L', (0xEF8,1,11), (None, None,                           ('SetOption',   '"SO93 {}".format($)')) ),
@@ -1860,11 +1932,9 @@ SETTING_8_2_0_6['flag4'][1].update  ({
 SETTING_8_3_1_0 = copy.copy(SETTING_8_2_0_6)
 # ======================================================================
 SETTING_8_3_1_1 = copy.copy(SETTING_8_3_1_0)
-SETTING_8_3_1_1[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)].pop()  # SET_MAX
-SETTING_8_3_1_1[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)].extend(['SET_DEVICENAME'])
-SETTING_8_3_1_1[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)].extend(['SET_MAX'])
-SETTING_8_3_1_1[SETTINGVAR].update({HARDWARE.hstr(HARDWARE.ESP82): copy.copy(SETTING_8_3_1_1[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)])})
-SETTING_8_3_1_1[SETTINGVAR].update({HARDWARE.hstr(HARDWARE.ESP32): copy.copy(SETTING_8_3_1_1[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)])})
+SETTING_8_3_1_1[SETTINGVAR][HSTR_ESP][-1:-1] = ['SET_DEVICENAME']  # insert before SET_MAX
+SETTING_8_3_1_1[SETTINGVAR].update({HSTR_ESP82: copy.copy(SETTING_8_3_1_1[SETTINGVAR][HSTR_ESP])})
+SETTING_8_3_1_1[SETTINGVAR].update({HSTR_ESP32: copy.copy(SETTING_8_3_1_1[SETTINGVAR][HSTR_ESP])})
 SETTING_8_3_1_1.update              ({
     'devicename':                   (HARDWARE.ESP,   '699s',(0x017,'SET_DEVICENAME'),
                                                                          (None, None,                           ('Management',  '"DeviceName {}".format("\\"" if len($) == 0 else $)')) ),
@@ -1872,7 +1942,7 @@ SETTING_8_3_1_1.update              ({
 # ======================================================================
 SETTING_8_3_1_2 = copy.copy(SETTING_8_3_1_1)
 SETTING_8_3_1_2.update              ({
-    'ledpwm_mask':                  (HARDWARE.ESP,   'B',   0xE8F,       (None, None,                           ('Control',     'list("LedPwmMode{} {}".format(i+1, 1 if ($ & (1<<i)) else 0) for i in range(0, 4))')) ),
+    'ledpwm_mask':                  (HARDWARE.ESP,   'B',   0xE8F,       (None, None,                           ('Control',     '["LedPwmMode{} {}".format(i+1, 1 if ($ & (1<<i)) else 0) for i in range(0, 4)]')) ),
     'ledpwm_on':                    (HARDWARE.ESP,   'B',   0xF3F,       (None, None,                           ('Control',     '"LedPwmOn {}".format($)')) ),
     'ledpwm_off':                   (HARDWARE.ESP,   'B',   0xF40,       (None, None,                           ('Control',     '"LedPwmOff {}".format($)')) ),
                                     })
@@ -1889,11 +1959,9 @@ SETTING_8_3_1_2['flag4'][1].update  ({
                                     })
 # ======================================================================
 SETTING_8_3_1_3 = copy.copy(SETTING_8_3_1_2)
-SETTING_8_3_1_3[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)].pop()  # SET_MAX
-SETTING_8_3_1_3[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)].extend(['SET_TELEGRAM_TOKEN', 'SET_TELEGRAM_CHATID'])
-SETTING_8_3_1_3[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)].extend(['SET_MAX'])
-SETTING_8_3_1_3[SETTINGVAR].update({HARDWARE.hstr(HARDWARE.ESP82): copy.copy(SETTING_8_3_1_3[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)])})
-SETTING_8_3_1_3[SETTINGVAR].update({HARDWARE.hstr(HARDWARE.ESP32): copy.copy(SETTING_8_3_1_3[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)])})
+SETTING_8_3_1_3[SETTINGVAR][HSTR_ESP][-1:-1] = ['SET_TELEGRAM_TOKEN', 'SET_TELEGRAM_CHATID']  # insert before SET_MAX
+SETTING_8_3_1_3[SETTINGVAR].update({HSTR_ESP82: copy.copy(SETTING_8_3_1_3[SETTINGVAR][HSTR_ESP])})
+SETTING_8_3_1_3[SETTINGVAR].update({HSTR_ESP32: copy.copy(SETTING_8_3_1_3[SETTINGVAR][HSTR_ESP])})
 SETTING_8_3_1_3.update              ({
     'telegram_token':               (HARDWARE.ESP,   '699s',(0x017,'SET_TELEGRAM_TOKEN'),
                                                                          (None, None,                           ('Telegram',    '"TmToken {}".format("\\"" if len($) == 0 else $)')) ),
@@ -1932,7 +2000,7 @@ SETTING_8_3_1_6['flag4'][1].update  ({
 # ======================================================================
 SETTING_8_3_1_7 = copy.copy(SETTING_8_3_1_6)
 SETTING_8_3_1_7.update              ({
-    'rules':                        (HARDWARE.ESP,   '512s',0x800,       ([3],  None,                           ('Rules',       '"Rule{} \\"".format(#+1) if len($) == 0 else list("Rule{} {}{}".format(#+1, "+" if i else "", s) for i, s in enumerate(textwrap.wrap($, width=512))) if ARGS.cmnduseruleconcat else "Rule{} {}".format(#+1,$)')), (rulesread, ruleswrite)),
+    'rules':                        (HARDWARE.ESP,   '512s',0x800,       ([3],  None,                           ('Rules',       '"Rule{} \\"".format(#+1) if len($) == 0 else ["Rule{} {}{}".format(#+1, "+" if i else "", s) for i, s in enumerate(textwrap.wrap($, width=512))] if ARGS.cmnduseruleconcat else "Rule{} {}".format(#+1,$)')), (rulesread, ruleswrite)),
     'scripting_used':               (HARDWARE.ESP,   'B',  (0x4A0,1,7),  (None, None,                           ('Rules',       None)), (False, False)),
     'scripting_compressed':         (HARDWARE.ESP,   'B',  (0x4A0,1,6),  (None, None,                           ('Rules',       None)), (False, False)),
     'script_enabled':               (HARDWARE.ESP,   'B',  (0x49F,1,0),  (None, None,                           ('Rules',       '"Script {}".format($)')), isscript),
@@ -1952,20 +2020,12 @@ SETTING_8_3_1_7['timer'][1].update  ({
                                     })
 # ======================================================================
 SETTING_8_4_0_0 = copy.copy(SETTING_8_3_1_7)
-SETTING_8_4_0_0[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)].pop()  # SET_MAX
-SETTING_8_4_0_0[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP82)].pop()  # SET_MAX
-SETTING_8_4_0_0[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP32)].pop()  # SET_MAX
-SETTING_8_4_0_0[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)].extend(['SET_ADC_PARAM1'])
-SETTING_8_4_0_0[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP82)].extend(['SET_ADC_PARAM1'])
-SETTING_8_4_0_0[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP32)].extend(['SET_ADC_PARAM1', 'SET_ADC_PARAM2', 'SET_ADC_PARAM3', 'SET_ADC_PARAM4', 'SET_ADC_PARAM5', 'SET_ADC_PARAM6', 'SET_ADC_PARAM7', 'SET_ADC_PARAM8'])
-SETTING_8_4_0_0[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)].extend(['SET_MAX'])
-SETTING_8_4_0_0[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP82)].extend(['SET_MAX'])
-SETTING_8_4_0_0[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP32)].extend(['SET_MAX'])
+SETTING_8_4_0_0[SETTINGVAR][HSTR_ESP][-1:-1] = ['SET_ADC_PARAM1']  # insert before SET_MAX
+SETTING_8_4_0_0[SETTINGVAR][HSTR_ESP82][-1:-1] = ['SET_ADC_PARAM1']  # insert before SET_MAX
+SETTING_8_4_0_0[SETTINGVAR][HSTR_ESP32][-1:-1] = ['SET_ADC_PARAM1', 'SET_ADC_PARAM2', 'SET_ADC_PARAM3', 'SET_ADC_PARAM4', 'SET_ADC_PARAM5', 'SET_ADC_PARAM6', 'SET_ADC_PARAM7', 'SET_ADC_PARAM8']  # insert before SET_MAX
 SETTING_8_4_0_0.update              ({
     'adc_param32':                  (HARDWARE.ESP32, '699s',(0x017,'SET_ADC_PARAM1'),
                                                                          ([8],  None,                           ('Management',  None)) ),
-                                    })
-SETTING_8_4_0_0.update              ({
     'adc_param':                    (HARDWARE.ESP82, '699s',(0x017,'SET_ADC_PARAM1'),
                                                                          (None,  None,                          ('Management',  None)) ),
                                     })
@@ -1997,15 +2057,13 @@ SETTING_8_4_0_3.update              ({
                                     })
 SETTING_8_4_0_3['flag4'][1].update  ({
         'alexa_gen_1':              (HARDWARE.ESP,   '<L', (0xEF8,1,27), (None, None,                           ('SetOption',   '"SO109 {}".format($)')) ),
-                                    })
-SETTING_8_4_0_3['flag4'][1].update  ({
         'suppress_irq_no_Event':    (HARDWARE.ESP,   'B',  (0xF15,1, 4), (None, None,                           ('Sensor',      '"AS3935NoIrqEvent {}".format($)')) ),
                                     })
 # ======================================================================
 SETTING_8_5_0_1 = copy.copy(SETTING_8_4_0_3)
 SETTING_8_5_0_1.update              ({
     'shutter_mode':                 (HARDWARE.ESP,   'B',  0xF43,       (None, '0 <= $ <= 7',                   ('Shutter',     '"ShutterMode {}".format($)')) ),
-    'shutter_pwmrange':             (HARDWARE.ESP,   '<H', 0xF4A,       ([2,4],'1 <= $ <= 1023',                ('Shutter',     'list("ShutterPWMRange{} {}".format(k+1, list(" ".join(str(@["shutter_pwmrange"][i][j]) for i in range(0, len(@["shutter_pwmrange"]))) for j in range(0, len(@["shutter_pwmrange"][0])))[k]) for k in range(0,len(@["shutter_pwmrange"][0])))')) ),
+    'shutter_pwmrange':             (HARDWARE.ESP,   '<H', 0xF4A,       ([2,4],'1 <= $ <= 1023',                ('Shutter',     '["ShutterPWMRange{} {}".format(k+1, [" ".join(str(@["shutter_pwmrange"][i][j]) for i in range(0, len(@["shutter_pwmrange"]))) for j in range(0, len(@["shutter_pwmrange"][0]))][k]) for k in range(0,len(@["shutter_pwmrange"][0]))]')) ),
     'hass_new_discovery':           (HARDWARE.ESP,   '<H', 0xE98,       (None, None,                            (INTERNAL,      None)) ),
     'tuyamcu_topic':                (HARDWARE.ESP,   'B',  0x33F,       (None, '0 <= $ <= 1',                   ('Serial',      None)) ),
                                     })
@@ -2059,18 +2117,9 @@ SETTING_9_0_0_2['flag4'][1].update  ({
                                     })
 # ======================================================================
 SETTING_9_0_0_3 = copy.copy(SETTING_9_0_0_2)
-SETTING_9_0_0_3[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)].pop()    # SET_MAX
-SETTING_9_0_0_3[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP82)].pop()  # SET_MAX
-SETTING_9_0_0_3[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP32)].pop()  # SET_MAX
-SETTING_9_0_0_3[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)].extend(['SET_SWITCH_TXT1', 'SET_SWITCH_TXT2', 'SET_SWITCH_TXT3', 'SET_SWITCH_TXT4', 'SET_SWITCH_TXT5', 'SET_SWITCH_TXT6', 'SET_SWITCH_TXT7', 'SET_SWITCH_TXT8'])
-SETTING_9_0_0_3[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP82)].extend(['SET_SWITCH_TXT1', 'SET_SWITCH_TXT2', 'SET_SWITCH_TXT3', 'SET_SWITCH_TXT4', 'SET_SWITCH_TXT5', 'SET_SWITCH_TXT6', 'SET_SWITCH_TXT7', 'SET_SWITCH_TXT8'])
-SETTING_9_0_0_3[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP32)].extend(['SET_SWITCH_TXT1', 'SET_SWITCH_TXT2', 'SET_SWITCH_TXT3', 'SET_SWITCH_TXT4', 'SET_SWITCH_TXT5', 'SET_SWITCH_TXT6', 'SET_SWITCH_TXT7', 'SET_SWITCH_TXT8'])
-SETTING_9_0_0_3[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)].extend(['SET_SHD_PARAM'])
-SETTING_9_0_0_3[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP82)].extend(['SET_SHD_PARAM'])
-SETTING_9_0_0_3[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP32)].extend(['SET_SHD_PARAM'])
-SETTING_9_0_0_3[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)].extend(['SET_MAX'])
-SETTING_9_0_0_3[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP82)].extend(['SET_MAX'])
-SETTING_9_0_0_3[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP32)].extend(['SET_MAX'])
+SETTING_9_0_0_3[SETTINGVAR][HSTR_ESP][-1:-1] = ['SET_SWITCH_TXT1', 'SET_SWITCH_TXT2', 'SET_SWITCH_TXT3', 'SET_SWITCH_TXT4', 'SET_SWITCH_TXT5', 'SET_SWITCH_TXT6', 'SET_SWITCH_TXT7', 'SET_SWITCH_TXT8', 'SET_SHD_PARAM']  # insert before SET_MAX
+SETTING_9_0_0_3[SETTINGVAR][HSTR_ESP82][-1:-1] = ['SET_SWITCH_TXT1', 'SET_SWITCH_TXT2', 'SET_SWITCH_TXT3', 'SET_SWITCH_TXT4', 'SET_SWITCH_TXT5', 'SET_SWITCH_TXT6', 'SET_SWITCH_TXT7', 'SET_SWITCH_TXT8', 'SET_SHD_PARAM']  # insert before SET_MAX
+SETTING_9_0_0_3[SETTINGVAR][HSTR_ESP32][-1:-1] = ['SET_SWITCH_TXT1', 'SET_SWITCH_TXT2', 'SET_SWITCH_TXT3', 'SET_SWITCH_TXT4', 'SET_SWITCH_TXT5', 'SET_SWITCH_TXT6', 'SET_SWITCH_TXT7', 'SET_SWITCH_TXT8', 'SET_SHD_PARAM']  # insert before SET_MAX
 SETTING_9_0_0_3.update              ({
     'switchtext':                   (HARDWARE.ESP, '699s',(0x017,'SET_SWITCH_TXT1'),
                                                                          ([8],  None,                           ('Management',  '"SwitchText{} {}".format(#+1,"\\"" if len($) == 0 else $)')) ),
@@ -2123,20 +2172,16 @@ SETTING_9_2_0_4['flag5'][1].update  ({
         'zb_topic_endpoint':        (HARDWARE.ESP,   '<L', (0xFB4,1, 6), (None, None,                           ('SetOption',   '"SO120 {}".format($)')) ),
                                     })
 # ======================================================================
-SETTING_9_2_0_5 = copy.deepcopy(SETTING_9_2_0_4)
+SETTING_9_2_0_5 = setting_copy(SETTING_9_2_0_4)
 SETTING_9_2_0_5.update              ({
     'power_esp32':                  (HARDWARE.ESP32, '<L',  0x2E8,       (None, '0 <= $ <= 0b1111111111111111111111111111',
-                                                                                                                ('Control',     'list("Power{} {}".format(i+1, (int($,0)>>i & 1) ) for i in range(0, 28))')),'"0x{:08x}".format($)' ),
+                                                                                                                ('Control',     '["Power{} {}".format(i+1, (int($,0)>>i & 1) ) for i in range(0, 28)]')),'"0x{:08x}".format($)' ),
                                     })
 # ======================================================================
 SETTING_9_2_0_6 = copy.copy(SETTING_9_2_0_5)
-SETTING_9_2_0_6[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP32)].pop()  # SET_MAX
-SETTING_9_2_0_6[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP32)].pop()  # SET_SHD_PARAM
-SETTING_9_2_0_6[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP32)].extend(['SET_SWITCH_TXT9', 'SET_SWITCH_TXT10', 'SET_SWITCH_TXT11', 'SET_SWITCH_TXT12', 'SET_SWITCH_TXT13', 'SET_SWITCH_TXT14', 'SET_SWITCH_TXT15', 'SET_SWITCH_TXT16',
-                                                       'SET_SWITCH_TXT17', 'SET_SWITCH_TXT18', 'SET_SWITCH_TXT19', 'SET_SWITCH_TXT20', 'SET_SWITCH_TXT21', 'SET_SWITCH_TXT22', 'SET_SWITCH_TXT23', 'SET_SWITCH_TXT24',
-                                                       'SET_SWITCH_TXT25', 'SET_SWITCH_TXT26', 'SET_SWITCH_TXT27', 'SET_SWITCH_TXT28'])
-SETTING_9_2_0_6[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP32)].extend(['SET_SHD_PARAM'])
-SETTING_9_2_0_6[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP32)].extend(['SET_MAX'])
+SETTING_9_2_0_6[SETTINGVAR][HSTR_ESP32][-2:-2] = ['SET_SWITCH_TXT9', 'SET_SWITCH_TXT10', 'SET_SWITCH_TXT11', 'SET_SWITCH_TXT12', 'SET_SWITCH_TXT13', 'SET_SWITCH_TXT14', 'SET_SWITCH_TXT15', 'SET_SWITCH_TXT16',
+                                                         'SET_SWITCH_TXT17', 'SET_SWITCH_TXT18', 'SET_SWITCH_TXT19', 'SET_SWITCH_TXT20', 'SET_SWITCH_TXT21', 'SET_SWITCH_TXT22', 'SET_SWITCH_TXT23', 'SET_SWITCH_TXT24',
+                                                         'SET_SWITCH_TXT25', 'SET_SWITCH_TXT26', 'SET_SWITCH_TXT27', 'SET_SWITCH_TXT28']  # insert before SET_SHD_PARAM, SET_MAX
 
 SETTING_9_2_0_6.update              ({
     'switchtext':                   (HARDWARE.ESP82, '699s',(0x017,'SET_SWITCH_TXT1'),
@@ -2241,24 +2286,18 @@ SETTING_9_5_0_3.update              ({
 # ======================================================================
 SETTING_9_5_0_4 = copy.copy(SETTING_9_5_0_3)
 SETTING_9_5_0_4.update              ({
-    'ip_address':                   (HARDWARE.ESP,   '<L',  0x544,       ([5],  None,                           ('Wifi',        '"IPAddress{} {}".format(#+1,$)')), ("socket.inet_ntoa(struct.pack('<L', $))", "struct.unpack('<L', socket.inet_aton($))[0]")),
+    'ip_address':                   (HARDWARE.ESP,   '<L',  0x544,       ([5],  None,                           ('Wifi',        '"IPAddress{} {}".format(#+1,$)')), (ipv4read, ipv4write)),
     'energy_kWhtotal':              (HARDWARE.ESP,   '<L',  0xF9C,       (None, '0 <= $ <= 4294967295',         ('Power',       '"EnergyReset3 {} {}".format(int(round(float($)//100)), @["energy_kWhtotal_time"])')) ),
                                     })
 # ======================================================================
 SETTING_9_5_0_5 = copy.copy(SETTING_9_5_0_4)
-SETTING_9_5_0_5[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)].pop()    # SET_MAX
-SETTING_9_5_0_5[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP32)].pop()  # SET_MAX
-SETTING_9_5_0_5[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP82)].pop()  # SET_MAX
-SETTING_9_5_0_5[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)].extend(['SET_RGX_SSID', 'SET_RGX_PASSWORD', 'SET_INFLUXDB_HOST', 'SET_INFLUXDB_PORT', 'SET_INFLUXDB_ORG', 'SET_INFLUXDB_TOKEN', 'SET_INFLUXDB_BUCKET'])
-SETTING_9_5_0_5[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP82)].extend(['SET_RGX_SSID', 'SET_RGX_PASSWORD', 'SET_INFLUXDB_HOST', 'SET_INFLUXDB_PORT', 'SET_INFLUXDB_ORG', 'SET_INFLUXDB_TOKEN', 'SET_INFLUXDB_BUCKET'])
-SETTING_9_5_0_5[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP32)].extend(['SET_RGX_SSID', 'SET_RGX_PASSWORD', 'SET_INFLUXDB_HOST', 'SET_INFLUXDB_PORT', 'SET_INFLUXDB_ORG', 'SET_INFLUXDB_TOKEN', 'SET_INFLUXDB_BUCKET'])
-SETTING_9_5_0_5[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)].extend(['SET_MAX'])
-SETTING_9_5_0_5[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP82)].extend(['SET_MAX'])
-SETTING_9_5_0_5[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP32)].extend(['SET_MAX'])
+SETTING_9_5_0_5[SETTINGVAR][HSTR_ESP][-1:-1] = ['SET_RGX_SSID', 'SET_RGX_PASSWORD', 'SET_INFLUXDB_HOST', 'SET_INFLUXDB_PORT', 'SET_INFLUXDB_ORG', 'SET_INFLUXDB_TOKEN', 'SET_INFLUXDB_BUCKET']  # insert before SET_MAX
+SETTING_9_5_0_5[SETTINGVAR][HSTR_ESP32][-1:-1] = ['SET_RGX_SSID', 'SET_RGX_PASSWORD', 'SET_INFLUXDB_HOST', 'SET_INFLUXDB_PORT', 'SET_INFLUXDB_ORG', 'SET_INFLUXDB_TOKEN', 'SET_INFLUXDB_BUCKET']  # insert before SET_MAX
+SETTING_9_5_0_5[SETTINGVAR][HSTR_ESP82][-1:-1] = ['SET_RGX_SSID', 'SET_RGX_PASSWORD', 'SET_INFLUXDB_HOST', 'SET_INFLUXDB_PORT', 'SET_INFLUXDB_ORG', 'SET_INFLUXDB_TOKEN', 'SET_INFLUXDB_BUCKET']  # insert before SET_MAX
 SETTING_9_5_0_5.pop('adc_param_type', None)
 SETTING_9_5_0_5.update              ({
-    'ipv4_rgx_address':             (HARDWARE.ESP,   '<L',  0x558,       (None, None,                           ('Wifi',        '"RgxAddress {}".format($)')), ("socket.inet_ntoa(struct.pack('<L', $))", "struct.unpack('<L', socket.inet_aton($))[0]") ),
-    'ipv4_rgx_subnetmask':          (HARDWARE.ESP,   '<L',  0x55C,       (None, None,                           ('Wifi',        '"RgxSubnet {}".format($)')), ("socket.inet_ntoa(struct.pack('<L', $))", "struct.unpack('<L', socket.inet_aton($))[0]") ),
+    'ipv4_rgx_address':             (HARDWARE.ESP,   '<L',  0x558,       (None, None,                           ('Wifi',        '"RgxAddress {}".format($)')), (ipv4read, ipv4write) ),
+    'ipv4_rgx_subnetmask':          (HARDWARE.ESP,   '<L',  0x55C,       (None, None,                           ('Wifi',        '"RgxSubnet {}".format($)')), (ipv4read, ipv4write) ),
     'influxdb_version':             (HARDWARE.ESP,   'B',   0xEF7,       (None, None,                           ('Management',  None)) ),
     'influxdb_port':                (HARDWARE.ESP,   '<H',  0x4CE,       (None, None,                           ('Management',  '"IfxPort {}".format($)')) ),
     'influxdb_host':                (HARDWARE.ESP82, '699s',(0x017,'SET_INFLUXDB_HOST'),
@@ -2323,7 +2362,7 @@ SETTING_9_5_0_9['flag5'][1].update  ({
 SETTING_10_0_0_1 = copy.copy(SETTING_9_5_0_9)
 SETTING_10_0_0_1.update             ({
     'tcp_config':                   (HARDWARE.ESP,   'B',   0xF5F,       (None, '0 <= $ <= 23',                 ('Serial',      '"TCPConfig {}".format(("5N1","6N1","7N1","8N1","5N2","6N2","7N2","8N2","5E1","6E1","7E1","8E1","5E2","6E2","7E2","8E2","5O1","6O1","7O1","8O1","5O2","6O2","7O2","8O2")[$ % 24])')) ),
-    'shutter_tilt_config':          (HARDWARE.ESP,   'b',   0x508,       ([5,4],None,                           ('Shutter',     'list("ShutterTiltConfig{} {}".format(k+1, list(",".join(str(@["shutter_tilt_config"][i][j]) for i in range(0, len(@["shutter_tilt_config"]))) for j in range(0, len(@["shutter_tilt_config"][0])))[k]) for k in range(0,len(@["shutter_tilt_config"][0])))')) ),
+    'shutter_tilt_config':          (HARDWARE.ESP,   'b',   0x508,       ([5,4],None,                           ('Shutter',     '["ShutterTiltConfig{} {}".format(k+1, [",".join(str(@["shutter_tilt_config"][i][j]) for i in range(0, len(@["shutter_tilt_config"]))) for j in range(0, len(@["shutter_tilt_config"][0]))][k]) for k in range(0,len(@["shutter_tilt_config"][0]))]')) ),
     'shutter_tilt_pos':             (HARDWARE.ESP,   'b',   0x51C,       ([4],  None,                           ('Shutter',     None)) ),
                                     })
 # ======================================================================
@@ -2353,12 +2392,12 @@ SETTING_10_1_0_3.update             ({
     'sserial_config':               (HARDWARE.ESP,   'B',   0x33E,       (None, None,                           ('Serial',      '"SSerialConfig {}".format(("5N1","6N1","7N1","8N1","5N2","6N2","7N2","8N2","5E1","6E1","7E1","8E1","5E2","6E2","7E2","8E2","5O1","6O1","7O1","8O1","5O2","6O2","7O2","8O2")[$ % 24])')) ),
                                     })
 # ======================================================================
-SETTING_10_1_0_5 = copy.deepcopy(SETTING_10_1_0_3)
+SETTING_10_1_0_5 = copy.copy(SETTING_10_1_0_3)
 SETTING_10_1_0_5.update             ({
-    'eth_ipv4_address':             (HARDWARE.ESP32, '<L',  0xF88,       ([5], None,                            ('Wifi',        'list("{} {}".format(["EthIPAddress","EthGateway","EthSubnetmask","EthDNSServer","EthDNSServer2"][i], socket.inet_ntoa(struct.pack("<L", @["eth_ipv4_address"][i]))) for i in range(0, len(@["eth_ipv4_address"])))')), ("socket.inet_ntoa(struct.pack('<L', $))", "struct.unpack('<L', socket.inet_aton($))[0]") ),
+    'eth_ipv4_address':             (HARDWARE.ESP32, '<L',  0xF88,       ([5], None,                            ('Wifi',        '["{} {}".format(["EthIPAddress","EthGateway","EthSubnetmask","EthDNSServer","EthDNSServer2"][i], socket.inet_ntoa(struct.pack("<L", @["eth_ipv4_address"][i]))) for i in range(0, len(@["eth_ipv4_address"]))]')), (ipv4read, ipv4write) ),
                                     })
 # ======================================================================
-SETTING_10_1_0_6 = copy.deepcopy(SETTING_10_1_0_5)
+SETTING_10_1_0_6 = setting_copy(SETTING_10_1_0_5)
 SETTING_10_1_0_6.update             ({
     'web_time_start':               (HARDWARE.ESP,   'B',   0x33C,       (None, None,                           ('Management',  '"WebTime {},{}".format($,@["web_time_end"])')) ),
     'web_time_end':                 (HARDWARE.ESP,   'B',   0x33D,       (None, None,                           ('Management',  None)) ),
@@ -2482,7 +2521,7 @@ SETTING_10_1_0_6['flag5'][1].update ({
         'pwm_force_same_phase':     (HARDWARE.ESP,   '<L', (0xFB4,1,20), (None, None,                           ('SetOption',   '"SO134 {}".format($)')) ),
                                     })
 # ======================================================================
-SETTING_11_0_0_3 = copy.deepcopy(SETTING_10_1_0_6)
+SETTING_11_0_0_3 = setting_copy(SETTING_10_1_0_6)
 SETTING_11_0_0_3.update             ({
     'pulse_timer':                  (HARDWARE.ESP,   '<H',  0x57C,       ([32], '0 <= $ <= 65535',              ('Control',     '"PulseTime{} {}".format(#+1,$)')) ),
     'rf_duplicate_time':            (HARDWARE.ESP,   '<H',  0x522,       (None, '10 <= $ <= 65535',             ('Rf',          '"RfTimeOut {}".format($)')) ),
@@ -2503,7 +2542,7 @@ SETTING_11_0_0_4['flag5'][1].update ({
         'tuya_exclude_heartbeat':   (HARDWARE.ESP,   '<L', (0xFB4,1,23), (None, None,                           ('SetOption',   '"SO137 {}".format($)')) ),
                                     })
 # ======================================================================
-SETTING_11_0_0_5 = copy.deepcopy(SETTING_11_0_0_4)
+SETTING_11_0_0_5 = setting_copy(SETTING_11_0_0_4)
 SETTING_11_0_0_5.update             ({
     'weight_absconv_a':             (HARDWARE.ESP,   '<l',  0x524,       (None, None,                           ('Sensor',      None)) ),
     'weight_absconv_b':             (HARDWARE.ESP,   '<l',  0x528,       (None, None,                           ('Sensor',      None)) ),
@@ -2516,13 +2555,13 @@ SETTING_11_0_0_5['flag5'][1].update ({
         'tuya_exclude_from_mqtt':   (HARDWARE.ESP,   '<L', (0xFB4,1,23), (None, None,                           ('SetOption',   '"SO137 {}".format($)')) ),
                                     })
 # ======================================================================
-SETTING_11_0_0_6 = copy.deepcopy(SETTING_11_0_0_5)
+SETTING_11_0_0_6 = copy.copy(SETTING_11_0_0_5)
 SETTING_11_0_0_6.update             ({
     'weight_absconv_a':             (HARDWARE.ESP,   '<l',  0x524,       (None, None,                           ('Sensor',      '"Sensor34 10 {}".format($)')) ),
     'weight_absconv_b':             (HARDWARE.ESP,   '<l',  0x528,       (None, None,                           ('Sensor',      '"Sensor34 11 {}".format($)')) ),
                                     })
 # ======================================================================
-SETTING_11_0_0_7 = copy.deepcopy(SETTING_11_0_0_6)
+SETTING_11_0_0_7 = setting_copy(SETTING_11_0_0_6)
 SETTING_11_0_0_7.update             ({
     'weight_offset':                (HARDWARE.ESP,   '<l',  0x578,       (None, None,                           ('Sensor',      None)) ),
     'weight_user_tare':             (HARDWARE.ESP,   '<l',  0x338,       (None, None,                           ('Sensor',      '"Sensor34 10 {}".format($)')) ),
@@ -2534,23 +2573,14 @@ SETTING_11_0_0_7['flag5'][1].update ({
                                     })
 # ======================================================================
 SETTING_11_1_0_1 = copy.copy(SETTING_11_0_0_7)
-SETTING_11_1_0_1[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)].pop()    # SET_MAX
-SETTING_11_1_0_1[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP32)].pop()  # SET_MAX
-SETTING_11_1_0_1[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP82)].pop()  # SET_MAX
-SETTING_11_1_0_1[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)].extend(['SET_INFLUXDB_RP'])
-SETTING_11_1_0_1[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP82)].extend(['SET_INFLUXDB_RP'])
-SETTING_11_1_0_1[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP32)].extend(['SET_INFLUXDB_RP'])
-SETTING_11_1_0_1[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)].extend(['SET_MAX'])
-SETTING_11_1_0_1[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP82)].extend(['SET_MAX'])
-SETTING_11_1_0_1[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP32)].extend(['SET_MAX'])
+SETTING_11_1_0_1[SETTINGVAR][HSTR_ESP][-1:-1] = ['SET_INFLUXDB_RP']  # insert before SET_MAX
+SETTING_11_1_0_1[SETTINGVAR][HSTR_ESP32][-1:-1] = ['SET_INFLUXDB_RP']  # insert before SET_MAX
+SETTING_11_1_0_1[SETTINGVAR][HSTR_ESP82][-1:-1] = ['SET_INFLUXDB_RP']  # insert before SET_MAX
 SETTING_11_1_0_1.update             ({
     'influxdb_rp':                  (HARDWARE.ESP82, '699s',(0x017,'SET_INFLUXDB_RP'),
                                                                          (None,  None,                          ('Management',  '"IfxRP {}".format("\\"" if len($) == 0 else $$)')) ),
     'influxdb_rp32':                (HARDWARE.ESP32, '699s',(0x017,'SET_INFLUXDB_RP'),
                                                                          (None,  None,                          ('Management',  '"IfxRP {}".format("\\"" if len($) == 0 else $)')) ),
-                                    })
-
-SETTING_11_1_0_1.update             ({
     'energy_kWhexport_ph':          (HARDWARE.ESP,   '<l',  0xF7C,       ([3], '0 <= $ <= 4294967295',          ('Power',       '"EnergyExportActive{} {}".format(#+1,int(round(float($)//100)))')) ),
     'flowratemeter_calibration':    (HARDWARE.ESP,   '<H',  0xF78,       ([2], None,                            ('Sensor',      '"Sensor96 {} {}".format(#+1,$)'))),
                                     })
@@ -2561,7 +2591,7 @@ SETTING_11_1_0_1['SensorBits1'][1].update ({
         'flowratemeter_unit':       (HARDWARE.ESP,   'B',  (0x717,1, 1), (None, '0 <= $ <= 1',                  ('Sensor',      '"Sensor96 0 {}".format($)')) ),
                                     })
 # ======================================================================
-SETTING_11_1_0_2 = copy.deepcopy(SETTING_11_1_0_1)
+SETTING_11_1_0_2 = setting_copy(SETTING_11_1_0_1)
 SETTING_11_1_0_2.update             ({
     'webcam_config2':               (HARDWARE.ESP32, {
         'wb_mode':                  (HARDWARE.ESP32, '<L', (0x730,3, 0), (None, '0 <= $ <= 6',                  ('Control',     '"WCWBMode {}".format($)')) ),
@@ -2625,7 +2655,7 @@ SETTING_11_1_0_2['flag5'][1].update ({
         'mqtt_persistent':          (HARDWARE.ESP,   '<L', (0xFB4,1,26), (None, None,                           ('SetOption',   '"SO140 {}".format($)')) ),
                                     })
 # ======================================================================
-SETTING_11_1_0_3 = copy.deepcopy(SETTING_11_1_0_2)
+SETTING_11_1_0_3 = setting_copy(SETTING_11_1_0_2)
 SETTING_11_1_0_3.update             ({
     'flag6':                        (HARDWARE.ESP,   '<L',  0xF74,       (None, None,                           (INTERNAL,      None)), '"0x{:08x}".format($)' ),
                                     })
@@ -2667,12 +2697,12 @@ SETTING_12_0_2_4.pop('energy_kWhtoday',None)
 SETTING_12_0_2_4.pop('energy_kWhyesterday',None)
 SETTING_12_0_2_4.pop('energy_kWhtotal',None)
 # ======================================================================
-SETTING_12_1_0_1 = copy.deepcopy(SETTING_12_0_2_4)
+SETTING_12_1_0_1 = setting_copy(SETTING_12_0_2_4)
 SETTING_12_1_0_1['flag5'][1].update ({
         'mqtt_status_retain':       (HARDWARE.ESP,   '<L', (0xFB4,1,31), (None, None,                           ('MQTT',        '"StatusRetain {}".format($)')) ),
                                     })
 # ======================================================================
-SETTING_12_1_1_1 = copy.deepcopy(SETTING_12_1_0_1)
+SETTING_12_1_1_1 = setting_copy(SETTING_12_1_0_1)
 SETTING_12_1_1_1.update             ({
     'flag6':                        (HARDWARE.ESP, {
         'use_esp32_temperature':    (HARDWARE.ESP,   '<L', (0xF74,1, 0), (None, None,                           ('SetOption',   '"SO146 {}".format($)')) ),
@@ -2699,7 +2729,7 @@ SETTING_12_1_1_6.update             ({
     'webcam_clk':                   (HARDWARE.ESP32, 'B',   0x72F,       (None, '10 <= $ <= 200',               ('Control',     '"WcClock {}".format($)')) ),
                                     })
 # ======================================================================
-SETTING_12_2_0_2 = copy.deepcopy(SETTING_12_1_1_6)
+SETTING_12_2_0_2 = setting_copy(SETTING_12_1_1_6)
 SETTING_12_2_0_2.pop('energy_kWhtotal',None)
 SETTING_12_2_0_2.update             ({
     'energy_power_calibration2':    (HARDWARE.ESP,   '<L',  0x370,       (None, None,                           ('Power',       '"PowerSet2 {}".format($)')) ),
@@ -2729,12 +2759,12 @@ SETTING_12_2_0_6.update             ({
     'shutter_motorstop':            (HARDWARE.ESP,   '<H',  0x738,       (None, None,                           ('Shutter',     '"ShutterMotorStop {}".format($)')) ),
                                     })
 # ======================================================================
-SETTING_12_3_1_1 = copy.deepcopy(SETTING_12_2_0_6)
+SETTING_12_3_1_1 = setting_copy(SETTING_12_2_0_6)
 SETTING_12_3_1_1['flag6'][1].update ({
         'dns_ipv6_priority':        (HARDWARE.ESP,   '<L', (0xF74,1, 3), (None, None,                           ('SetOption',   '"SO149 {}".format($)')) ),
                                     })
 # ======================================================================
-SETTING_12_3_1_5 = copy.deepcopy(SETTING_12_3_1_1)
+SETTING_12_3_1_5 = setting_copy(SETTING_12_3_1_1)
 SETTING_12_3_1_5['flag6'][1].update ({
         'no_voltage_common':        (HARDWARE.ESP,   '<L', (0xF74,1, 4), (None, None,                           ('SetOption',   '"SO150 {}".format($)')) ),
         'matter_enabled':           (HARDWARE.ESP,   '<L', (0xF74,1, 5), (None, None,                           ('SetOption',   '"SO151 {}".format($)')) ),
@@ -2748,18 +2778,18 @@ SETTING_12_4_0_2['teleinfo'][1].update({
         'show_stats':               (HARDWARE.ESP,   '<L', (0xFA4,1,12), (None, None,                           ('Power',       None)) ),
                                     })
 # ======================================================================
-SETTING_12_5_0_1 = copy.deepcopy(SETTING_12_4_0_2)
+SETTING_12_5_0_1 = setting_copy(SETTING_12_4_0_2)
 SETTING_12_5_0_1['flag6'][1].update ({
         'bistable_single_pin':      (HARDWARE.ESP,   '<L', (0xF74,1, 6), (None, None,                           ('SetOption',   '"SO152 {}".format($)')) ),
                                     })
 # ======================================================================
-SETTING_12_5_0_3 = copy.deepcopy(SETTING_12_5_0_1)
+SETTING_12_5_0_3 = setting_copy(SETTING_12_5_0_1)
 SETTING_12_5_0_3['flag6'][1].update ({
         'berry_no_autoexec':        (HARDWARE.ESP,   '<L', (0xF74,1, 7), (None, None,                           ('SetOption',   '"SO153 {}".format($)')) ),
         'berry_light_scheme':       (HARDWARE.ESP,   '<L', (0xF74,1, 8), (None, None,                           ('SetOption',   '"SO154 {}".format($)')) ),
                                     })
 # ======================================================================
-SETTING_13_0_0_1 = copy.deepcopy(SETTING_12_5_0_3)
+SETTING_13_0_0_1 = setting_copy(SETTING_12_5_0_3)
 SETTING_13_0_0_1.update             ({
     'zcdimmerset':                  (HARDWARE.ESP,   '<H',  0xEA6,       ([5],  None,                           ('Light',       '"ZCDimmerSet{} {}".format(#+1,$/100)')) ),
                                     })
@@ -2767,12 +2797,12 @@ SETTING_13_0_0_1['flag6'][1].update ({
         'zcfallingedge':            (HARDWARE.ESP,   '<L', (0xF74,1, 9), (None, None,                           ('SetOption',   '"SO155 {}".format($)')) ),
                                     })
 # ======================================================================
-SETTING_13_0_0_2 = copy.deepcopy(SETTING_13_0_0_1)
+SETTING_13_0_0_2 = copy.copy(SETTING_13_0_0_1)
 SETTING_13_0_0_2.update             ({
     'battery_level_percent':        (HARDWARE.ESP,   'B',   0x73A,       (None, '0 <= $ <= 101',                ('Zigbee',      '"BatteryPercentage {}".format($)')) ),
                                     })
 # ======================================================================
-SETTING_13_1_0_1 = copy.deepcopy(SETTING_13_0_0_2)
+SETTING_13_1_0_1 = setting_copy(SETTING_13_0_0_2)
 SETTING_13_1_0_1.update             ({
     'my_gp_esp32c2':                (HARDWARE.ESP32C2,
                                                      '<H',  0x3AC,       ([21], None,                           ('Management',  '"Gpio{} {}".format(#, $)')) ),
@@ -2797,7 +2827,7 @@ SETTING_13_1_0_1['flag6'][1].update ({
         'sen5x_passive_mode':       (HARDWARE.ESP,   '<L', (0xF74,1,10), (None, None,                           ('SetOption',   '"SO156 {}".format($)')) ),
                                     })
 # ======================================================================
-SETTING_13_1_0_2 = copy.deepcopy(SETTING_13_1_0_1)
+SETTING_13_1_0_2 = setting_copy(SETTING_13_1_0_1)
 SETTING_13_1_0_2.update             ({
     'hdmi_addr':                    (HARDWARE.ESP,   '<H',  0x73B,       (None, None,                           ('Hdmi',      '"HdmiAddr {}".format($)')) ),
     'hdmi_cec_device_type':         (HARDWARE.ESP,   'B',   0xF61,       (None, None,                           ('Hdmi',      '"HdmiType {}".format($)')) ),
@@ -2814,15 +2844,9 @@ SETTING_13_2_0_1['flag6'][1].update ({
                                     })
 # ======================================================================
 SETTING_13_2_0_3 = copy.copy(SETTING_13_2_0_1)
-SETTING_13_2_0_3[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)].pop()    # SET_MAX
-SETTING_13_2_0_3[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP32)].pop()  # SET_MAX
-SETTING_13_2_0_3[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP82)].pop()  # SET_MAX
-SETTING_13_2_0_3[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)].extend(['SET_CANVAS'])
-SETTING_13_2_0_3[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP82)].extend(['SET_CANVAS'])
-SETTING_13_2_0_3[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP32)].extend(['SET_CANVAS'])
-SETTING_13_2_0_3[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)].extend(['SET_MAX'])
-SETTING_13_2_0_3[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP82)].extend(['SET_MAX'])
-SETTING_13_2_0_3[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP32)].extend(['SET_MAX'])
+SETTING_13_2_0_3[SETTINGVAR][HSTR_ESP][-1:-1] = ['SET_CANVAS']  # insert before SET_MAX
+SETTING_13_2_0_3[SETTINGVAR][HSTR_ESP32][-1:-1] = ['SET_CANVAS']  # insert before SET_MAX
+SETTING_13_2_0_3[SETTINGVAR][HSTR_ESP82][-1:-1] = ['SET_CANVAS']  # insert before SET_MAX
 SETTING_13_2_0_3.update             ({
     'webcanvas':                    (HARDWARE.ESP82, '699s',(0x017,'SET_CANVAS'),
                                                                          (None,  None,                          ('Wifi',        '"WebCanvas {}".format("\\"" if len($) == 0 else $$)')) ),
@@ -2843,19 +2867,13 @@ SETTING_13_3_0_5['flag6'][1].update ({
 # ======================================================================
 SETTING_13_4_0_4 = copy.copy(SETTING_13_3_0_5)
 SETTING_13_4_0_4.update             ({
-     'power_lock':                  (HARDWARE.ESP,   '<L',  0xF9C,       (None, None,                           ('Control',     '"PowerLock0 0" if 0==int($) else "PowerLock0 1" if 0xffffffff==int($) else list("PowerLock{} {}".format(i+1, (int($)>>i & 1) ) for i in range(0, 32))')) ),
+     'power_lock':                  (HARDWARE.ESP,   '<L',  0xF9C,       (None, None,                           ('Control',     '"PowerLock0 0" if 0==int($) else "PowerLock0 1" if 0xffffffff==int($) else ["PowerLock{} {}".format(i+1, (int($)>>i & 1) ) for i in range(0, 32)]')) ),
                                     })
 # ======================================================================
 SETTING_14_0_0_2 = copy.copy(SETTING_13_4_0_4)
-SETTING_14_0_0_2[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)].pop()    # SET_MAX
-SETTING_14_0_0_2[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP32)].pop()  # SET_MAX
-SETTING_14_0_0_2[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP82)].pop()  # SET_MAX
-SETTING_14_0_0_2[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)].extend(['SET_TELEGRAM_FINGERPRINT'])
-SETTING_14_0_0_2[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP82)].extend(['SET_TELEGRAM_FINGERPRINT'])
-SETTING_14_0_0_2[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP32)].extend(['SET_TELEGRAM_FINGERPRINT'])
-SETTING_14_0_0_2[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)].extend(['SET_MAX'])
-SETTING_14_0_0_2[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP82)].extend(['SET_MAX'])
-SETTING_14_0_0_2[SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP32)].extend(['SET_MAX'])
+SETTING_14_0_0_2[SETTINGVAR][HSTR_ESP][-1:-1] = ['SET_TELEGRAM_FINGERPRINT']  # insert before SET_MAX
+SETTING_14_0_0_2[SETTINGVAR][HSTR_ESP32][-1:-1] = ['SET_TELEGRAM_FINGERPRINT']  # insert before SET_MAX
+SETTING_14_0_0_2[SETTINGVAR][HSTR_ESP82][-1:-1] = ['SET_TELEGRAM_FINGERPRINT']  # insert before SET_MAX
 SETTING_14_0_0_2.update             ({
     'telegram_fingerprint':         (HARDWARE.ESP,   '699s',(0x017,'SET_TELEGRAM_FINGERPRINT'),
                                                                          (None, None,                           ('Telegram',    '"TmFingerprint {}".format("1" if len($) == 0 else $)')) ),
@@ -2920,8 +2938,6 @@ SETTING_14_3_0_5 = copy.copy(SETTING_14_3_0_4)
 SETTING_14_3_0_5['flag6'][1].pop('disable_slider_updates',None)
 SETTING_14_3_0_5.update             ({
     'ms5837_pressure_offset':       (HARDWARE.ESP,   'f',   0xF6C,       (None, None,                           ('Sensor',      '"Sensor116 {}".format($)')), ),
-                                    })
-SETTING_14_3_0_5.update              ({
     'web_color2':                   (HARDWARE.ESP,   '3B',  0xEA0,       ([2],  None,                           ('Wifi',        '"WebColor{} {}{:06x}".format(#+19,chr(35),int($,0))')), '"0x{:06x}".format($)' ),
                                     })
 # ======================================================================
@@ -2929,7 +2945,7 @@ SETTING_14_3_0_7 = copy.copy(SETTING_14_3_0_5)
 SETTING_14_3_0_7.update             ({
     'switchmode':                   (HARDWARE.ESP82, 'B',   0x4A8,       ([32], '0 <= $ <= 16',                 ('Control',     '"SwitchMode{} {}".format(#+1,$)')) ),
     'switchmode_esp32':             (HARDWARE.ESP32, 'B',   0x4A8,       ([32], '0 <= $ <= 16',                 ('Control',     '"SwitchMode{} {}".format(#+1,$)')) ),
-    'shutter_tilt_config':          (HARDWARE.ESP,   'b',   0x510,       ([5,4],None,                           ('Shutter',     'list("ShutterTiltConfig{} {}".format(k+1, list(",".join(str(@["shutter_tilt_config"][i][j]) for i in range(0, len(@["shutter_tilt_config"]))) for j in range(0, len(@["shutter_tilt_config"][0])))[k]) for k in range(0,len(@["shutter_tilt_config"][0])))')) ),
+    'shutter_tilt_config':          (HARDWARE.ESP,   'b',   0x510,       ([5,4],None,                           ('Shutter',     '["ShutterTiltConfig{} {}".format(k+1, [",".join(str(@["shutter_tilt_config"][i][j]) for i in range(0, len(@["shutter_tilt_config"]))) for j in range(0, len(@["shutter_tilt_config"][0]))][k]) for k in range(0,len(@["shutter_tilt_config"][0]))]')) ),
     'knx_CB_registered':            (HARDWARE.ESP,   'B',   0x533,       (None, None,                           ('KNX',         None)) ),
     'shutter_tilt_pos':             (HARDWARE.ESP,   'b',   0x534,       ([4],  None,                           ('Shutter',     None)) ),
     'influxdb_period':              (HARDWARE.ESP,   '<H',  0x538,       (None, '0 <= $ <= 3600',               ('Management',  '"IfxPeriod {}".format($)')) ),
@@ -2946,7 +2962,7 @@ SETTING_14_4_1_1['flag6'][1].update ({
         'gui_device_name':          (HARDWARE.ESP,   '<L', (0xF74,1,17), (None, None,                           ('SetOption',   '"SO163 {}".format($)')) ),
                                     })
 # ======================================================================
-SETTINGS = [
+SETTINGS = (
             (0x0E040101,0x1000, SETTING_14_4_1_1),
             (0x0E030007,0x1000, SETTING_14_3_0_7),
             (0x0E030005,0x1000, SETTING_14_3_0_5),
@@ -3126,20 +3142,22 @@ SETTINGS = [
             (0x050c0000, 0x670, SETTING_5_12_0),
             (0x050b0000, 0x670, SETTING_5_11_0),
             (0x050a0000, 0x670, SETTING_5_10_0),
-           ]
+           )
 # pylint: enable=bad-continuation,bad-whitespace,invalid-name
 
+# SETTINGS sorted by ascending version and their versions
+SETTINGS_SORTED = sorted(SETTINGS, key=lambda s: s[0])
+SETTINGS_VERSIONS = [cfg[0] for cfg in SETTINGS_SORTED]
+
 def check_setting_definition():
     """
     Check complete setting definition history
 
     @return: True if ok
     """
-    for cfg in SETTINGS:
-        setting = cfg[2]
-        for key in setting:
+    for _, _, setting in SETTINGS:
+        for key, fielddef in setting.items():
             if key != SETTINGVAR:
-                fielddef = setting[key]
                 get_fielddef(fielddef)
 
     return True
@@ -3155,6 +3173,19 @@ class LogType:
     WARNING = 'WARNING'
     ERROR = 'ERROR'
 
+# log message templates indexed by bits: 1 = type given, 2 = status > 0, 4 = line given
+# format args are: type, status, line, message
+MESSAGE_TEMPLATES = (
+    '{3}',
+    '{0}: {3}',
+    '{1}{3}',
+    '{0} {1}: {3}',
+    '(@{2:04d}): {3}',
+    '{0}(@{2:04d}): {3}',
+    '{1}(@{2:04d}): {3}',
+    '{0} {1} (@{2:04d}): {3}',
+)
+
 def log(status=0, msg="end", type_=LogType.ERROR, src=None, doexit=None, line=None):
     """
     Called when the program should be exit
@@ -3182,16 +3213,8 @@ def log(status=0, msg="end", type_=LogType.ERROR, src=None, doexit=None, line=No
         @param status:
             status number
         """
-        sdelimiter = ' ' if status is not None and type_ is not None and status > 0 else ''
-        print('{styp}{sdelimiter1}{sstatus}{sdelimiter2}{slineno}{scolon}{smgs}'\
-            .format(styp=type_ if type_ is not None else '',
-                    sdelimiter1=sdelimiter,
-                    sdelimiter2=sdelimiter if line is not None else '',
-                    sstatus=status if status is not None and status > 0 else '',
-                    scolon=': ' if type_ is not None or line is not None else '',
-                    smgs=msg,
-                    slineno='(@{:04d})'.format(line) if line is not None else ''),
-            file=sys.stderr)
+        template = MESSAGE_TEMPLATES[(type_ is not None) | (status is not None and status > 0) << 1 | (line is not None) << 2]
+        sys.stderr.write(template.format(type_, status, line, msg) + '\n')
 
     if src is not None:
         msg = '{} ({})'.format(src, msg)
@@ -3204,7 +3227,7 @@ def log(status=0, msg="end", type_=LogType.ERROR, src=None, doexit=None, line=No
     if LogType.ERROR == type_ and doexit is None:
         doexit = True
     if doexit:
-        log(msg="Premature exit - #{} {}".format(status, ExitCode.str(status)), type_=None, status=None, line=None)
+        message("Premature exit - #{} {}".format(status, ExitCode.str(status)))
         sys.exit(EXIT_CODE)
 
 def shorthelp(doexit=True):
@@ -3774,24 +3797,22 @@ def get_config_info(decode_cfg):
     version = get_field(decode_cfg, HARDWARE.ESP, 'version', SETTING_6_2_1['version'], raw=True, ignoregroup=True)
     template_version = version
 
+    # search newest setting definition not exceeding version
+    cfg = None
+    idx = bisect.bisect_right(SETTINGS_VERSIONS, version)
+    if idx > 0:
+        cfg = SETTINGS_SORTED[idx-1]
+
     # identify hardware (config_version)
     config_version = HARDWARE.config_versions.index(HARDWARE.ESP82)  # default legacy
-    for cfg in sorted(SETTINGS, key=lambda s: s[0], reverse=True):
-        if version >= cfg[0]:
-            fielddef = cfg[2].get('config_version', None)
-            if fielddef is not None:
-                config_version = get_field(decode_cfg, HARDWARE.ESP, 'config_version', fielddef, raw=True, ignoregroup=True)
-                if config_version >= len(HARDWARE.config_versions):
-                    log(ExitCode.INVALID_DATA, "Invalid data in config (config_version is {}, valid range [0,{}])".format(config_version, len(HARDWARE.config_versions)-1), line=inspect.getlineno(inspect.currentframe()))
-                    config_version = HARDWARE.config_versions.index(HARDWARE.ESP82)
-            break
-    # search setting definition for hardware top-down
-    for cfg in sorted(SETTINGS, key=lambda s: s[0], reverse=True):
-        if version >= cfg[0]:
-            template_version = cfg[0]
-            size = cfg[1]
-            setting = cfg[2]
-            break
+    if cfg is not None:
+        fielddef = cfg[2].get('config_version', None)
+        if fielddef is not None:
+            config_version = get_field(decode_cfg, HARDWARE.ESP, 'config_version', fielddef, raw=True, ignoregroup=True)
+            if config_version >= len(HARDWARE.config_versions):
+                log(ExitCode.INVALID_DATA, "Invalid data in config (config_version is {}, valid range [0,{}])".format(config_version, len(HARDWARE.config_versions)-1), line=inspect.getlineno(inspect.currentframe()))
+                config_version = HARDWARE.config_versions.index(HARDWARE.ESP82)
+        template_version, size, setting = cfg
 
     if setting is None:
         log(ExitCode.UNSUPPORTED_VERSION, "Tasmota configuration version v{} not supported".format(get_versionstr(version)), line=inspect.getlineno(inspect.currentframe()))
@@ -4851,25 +4872,32 @@ def get_strindex(hardware, strindex_name):
     """
     # hardware = get_fielddef(fielddef, fields='hardware')
     try:
-        return CONFIG['info']['template'][SETTINGVAR][HARDWARE.hstr(hardware)].index(strindex_name)
+        strings = CONFIG['info']['template'][SETTINGVAR][HARDWARE.hstr(hardware)]
+        # name to index dicts are cached by object id of the string list
+        cached = STRINDEXES.get(id(strings))
+        if cached is None or cached[0] is not strings:
+            indexes = {}
+            for idx, name in enumerate(strings):
+                indexes.setdefault(name, idx)
+            cached = (strings, indexes)
+            STRINDEXES[id(strings)] = cached
+        return cached[1][strindex_name]
     except:     # pylint: disable=bare-except
         return -1
 
-def get_fielddef(fielddef, fields="hardware, format_, addrdef, baseaddr, bits, bitshift, strindex, datadef, arraydef, validate, cmd, group, tasmotacmnd, converter, readconverter, writeconverter"):
+def parse_fielddef(fielddef):
     """
-    Get field definition items
+    Parse and check a field definition
 
     @param fielddef:
         field format - see "Settings dictionary" above
-    @param fields:
-        comma separated string list of values to be returned
-        possible values see fields default
 
     @return:
-        set of values defined in <fields>
+        dict of field definition items (without strindex)
     """
     hardware = format_ = addrdef = baseaddr = datadef = arraydef = validate = cmd = group = tasmotacmnd = converter = readconverter = writeconverter = strindex = None
     bits = bitshift = 0
+    strindex_name = None
     raise_error = '<fielddef> error'
 
     # calling with None is wrong
@@ -4895,7 +4923,7 @@ def get_fielddef(fielddef, fields="hardware, format_, addrdef, baseaddr, bits, b
 
     # ignore calls with 'root' setting
     if isinstance(format_, dict) and baseaddr is None and datadef is None:
-        return eval(fields)     # pylint: disable=eval-used
+        return locals()
 
     if not isinstance(hardware, int):
         print("baseaddr: {} datadef: {}".format(baseaddr, datadef))
@@ -4921,17 +4949,6 @@ def get_fielddef(fielddef, fields="hardware, format_, addrdef, baseaddr, bits, b
         elif len(baseaddr) == 2:
             # baseaddr string definition
             baseaddr, strindex_name = baseaddr
-            if 'strindex' in fields:
-                if not isinstance(strindex_name, str):
-                    print('<strindex> must be defined as named index string in <fielddef> {}'.format(fielddef), file=sys.stderr)
-                    raise SyntaxError(raise_error)
-                try:
-                    strindex = get_strindex(hardware, strindex_name)
-                    if strindex < 0 or strindex >= CONFIG['info']['template'][SETTINGVAR][HARDWARE.hstr(hardware)].index('SET_MAX'):
-                        print('<strindex> out of range [0, {}] in <fielddef> {}'.format(CONFIG['info']['template'][SETTINGVAR][HARDWARE.hstr(hardware)].index('SET_MAX'), fielddef), file=sys.stderr)
-                        raise SyntaxError(raise_error)
-                except:     # pylint: disable=bare-except
-                    pass
         else:
             print('wrong <addrdef> {} length ({}) in <fielddef> {}'.format(addrdef, len(addrdef), fielddef), file=sys.stderr)
             raise SyntaxError(raise_error)
@@ -4998,7 +5015,76 @@ def get_fielddef(fielddef, fields="hardware, format_, addrdef, baseaddr, bits, b
             print('wrong <converter> {} length ({}) in <fielddef> {}'.format(converter, len(converter), fielddef), file=sys.stderr)
             raise SyntaxError(raise_error)
 
-    return eval(fields)     # pylint: disable=eval-used
+    return locals()
+
+
+def get_fielddef(fielddef, fields="hardware, format_, addrdef, baseaddr, bits, bitshift, strindex, datadef, arraydef, validate, cmd, group, tasmotacmnd, converter, readconverter, writeconverter"):
+    """
+    Get field definition items
+
+    @param fielddef:
+        field format - see "Settings dictionary" above
+    @param fields:
+        comma separated string list of values to be returned
+        possible values see fields default
+
+    @return:
+        set of values defined in <fields>
+    """
+    # parsed field definitions are cached by object id
+    cached = FIELDDEFS.get(id(fielddef))
+    if cached is None or cached[0] is not fielddef:
+        cached = (fielddef, parse_fielddef(fielddef))
+        FIELDDEFS[id(fielddef)] = cached
+    items = cached[1]
+
+    # requested item names are cached by fields string
+    if fields not in FIELDNAMES:
+        FIELDNAMES[fields] = tuple(name.strip() for name in fields.split(','))
+    names = FIELDNAMES[fields]
+
+    # strindex depends on the current template, get it on demand
+    strindex = None
+    strindex_name = items['strindex_name']
+    if strindex_name is not None and 'strindex' in names:
+        raise_error = '<fielddef> error'
+        hardware = items['hardware']
+        if not isinstance(strindex_name, str):
+            print('<strindex> must be defined as named index string in <fielddef> {}'.format(fielddef), file=sys.stderr)
+            raise SyntaxError(raise_error)
+        try:
+            strindex = get_strindex(hardware, strindex_name)
+            if strindex < 0 or strindex >= CONFIG['info']['template'][SETTINGVAR][HARDWARE.hstr(hardware)].index('SET_MAX'):
+                print('<strindex> out of range [0, {}] in <fielddef> {}'.format(CONFIG['info']['template'][SETTINGVAR][HARDWARE.hstr(hardware)].index('SET_MAX'), fielddef), file=sys.stderr)
+                raise SyntaxError(raise_error)
+        except:     # pylint: disable=bare-except
+            pass
+
+    values = tuple(strindex if name == 'strindex' else items[name] for name in names)
+    if len(values) == 1:
+        return values[0]
+    return values
+
+def compile_macros(func_):
+    """
+    Compile an evaluable string using macros
+
+    @param func_:
+        evaluable string using macros @ (valuemapping), $ (value)
+        and # (idx)
+
+    @return:
+        compiled code object
+    """
+    try:
+        return MACRO_CODES[func_]
+    except KeyError:
+        source = func_.replace('@', 'valuemapping')
+        source = source.replace('$', 'value')
+        source = source.replace('#', 'idx')
+        # eval() strips leading whitespace from strings, compile() does not
+        MACRO_CODES[func_] = compile(source.lstrip(' \t'), '<string>', 'eval')
+        return MACRO_CODES[func_]
 
 def exec_function(func_, value, idx=None):
     """
@@ -5021,14 +5107,12 @@ def exec_function(func_, value, idx=None):
                 idx = ''
             elif len(idx) == 1:
                 idx = idx[0]
-            valuemapping = copy.deepcopy(CONFIG['valuemapping'])    # pylint: disable=possibly-unused-variable
-            func_ = func_.replace('@', 'valuemapping')
-            func_ = func_.replace('$', 'value')
-            func_ = func_.replace('#', 'idx')
+            valuemapping = CONFIG['valuemapping']    # pylint: disable=possibly-unused-variable
+            code = compile_macros(func_)
             scope = locals()
             scope.update(SETTING_OBJECTS)
             scope.update({"ARGS": ARGS})
-            value = eval(func_, scope)      # pylint: disable=eval-used
+            value = eval(code, scope)      # pylint: disable=eval-used
 
         elif callable(func_):
             # use as format function
@@ -5148,7 +5232,18 @@ def validate_value(value, fielddef):
     valid = True
     try:
         if isinstance(validate, str): # evaluate strings
-            valid = eval(validate.replace('$', 'value'))    # pylint: disable=eval-used
+            if validate not in VALIDATE_CODES:
+                # simple range checks 'min <= $ <= max' are handled without eval
+                match = re.match(r'\s*(-?(?:0x[0-9a-fA-F]+|\d+))\s*<=\s*\$\s*<=\s*(-?(?:0x[0-9a-fA-F]+|\d+))\s*$', validate)
+                if match:
+                    VALIDATE_CODES[validate] = tuple(int(limit, 16 if 'x' in limit else 10) for limit in match.groups())
+                else:
+                    VALIDATE_CODES[validate] = compile(validate.replace('$', 'value').lstrip(' \t'), '<string>', 'eval')
+            code = VALIDATE_CODES[validate]
+            if isinstance(code, tuple):
+                valid = code[0] <= value <= code[1]
+            else:
+                valid = eval(code)    # pylint: disable=eval-used
         elif callable(validate):     # use as format function
             valid = validate(value)
     except:     # pylint: disable=bare-except
@@ -5156,6 +5251,22 @@ def validate_value(value, fielddef):
 
     return valid
 
+def get_struct(format_):
+    """
+    Get precompiled struct object for a format specifier
+
+    @param format_:
+        format specifier
+
+    @return:
+        struct.Struct object
+    """
+    try:
+        return STRUCTS[format_]
+    except KeyError:
+        STRUCTS[format_] = struct.Struct(format_)
+        return STRUCTS[format_]
+
 def get_formatcount(format_):
     """
     Get format prefix count
@@ -5167,9 +5278,10 @@ def get_formatcount(format_):
         prefix count or 1 if not specified
     """
     if isinstance(format_, str):
-        match = re.search(r'\s*(\d+)', format_)
-        if match:
-            return int(match.group(0))
+        if format_ not in FORMATCOUNTS:
+            match = re.search(r'\s*(\d+)', format_)
+            FORMATCOUNTS[format_] = int(match.group(0)) if match else 1
+        return FORMATCOUNTS[format_]
 
     return 1
 
@@ -5183,13 +5295,16 @@ def get_formattype(format_):
     @return:
         (format_, 0) or (format without prefix, bitsize)
     """
+    if isinstance(format_, str) and format_ in FORMATTYPES:
+        return FORMATTYPES[format_]
     formattype = format_
     bitsize = 0
     if isinstance(format_, str):
         match = re.search(r'\s*(\D+)', format_)
         if match:
             formattype = match.group(0)
-            bitsize = struct.calcsize(formattype) * 8
+            bitsize = get_struct(formattype).size * 8
+        FORMATTYPES[format_] = (formattype, bitsize)
     return formattype, bitsize
 
 def get_fieldminmax(fielddef):
@@ -5271,7 +5386,7 @@ def get_fieldlength(fielddef):
 
     # a simple value
     elif isinstance(format_, str):
-        length = struct.calcsize(format_)
+        length = get_struct(format_).size
 
     return length
 
@@ -5285,6 +5400,11 @@ def get_subfielddef(fielddef):
     @return:
         subfield definition
     """
+    # subfield definitions are cached by object id, so they keep their identity
+    cached = SUBFIELDDEFS.get(id(fielddef))
+    if cached is not None and cached[0] is fielddef:
+        return cached[1]
+
     hardware, format_, addrdef, datadef, arraydef, validate, cmd, converter = get_fielddef(fielddef, fields='hardware, format_, addrdef, datadef, arraydef, validate, cmd, converter')
 
     # create new arraydef
@@ -5308,6 +5428,7 @@ def get_subfielddef(fielddef):
         subfielddef = (hardware, format_, addrdef, datadef, converter)
     else:
         subfielddef = (hardware, format_, addrdef, datadef)
+    SUBFIELDDEFS[id(fielddef)] = (fielddef, subfielddef)
 
     return subfielddef
 
@@ -5350,14 +5471,16 @@ def get_fieldvalue(fieldname, fielddef, dobj, addr, idxoffset=0):
     hardware, format_, bits, bitshift, strindex = get_fielddef(fielddef, fields='hardware, format_, bits, bitshift, strindex')
 
     value_ = 0
-    unpackedvalue = struct.unpack_from(format_, dobj, addr)
+    unpackedvalue = get_struct(format_).unpack_from(dobj, addr)
     _, bitsize = get_formattype(format_)
 
     if not format_[-1:].lower() in ['s', 'p']:
         for val in unpackedvalue:
             value_ <<= bitsize
             value_ = value_ + val
-        value_ = bitsread(value_, bitshift, bits)
+        # plain integer values need no bit shift/mask
+        if bits or not isinstance(value_, int):
+            value_ = bitsread(value_, bitshift, bits)
     else:
         value_ = ""
 
@@ -5452,7 +5575,7 @@ def set_fieldvalue(fielddef, dobj, addr, value):
             if isinstance(value, int) and value < 0 and val > maxsigned:
                 val = ((maxunsigned+1)-val) * (-1)
             try:
-                struct.pack_into(singletype, dobj, addr, val)
+                get_struct(singletype).pack_into(dobj, addr, val)
             except struct.error as err:
                 log(ExitCode.RESTORE_DATA_ERROR,
                       "Single type {} [fielddef={}, addr=0x{:04x}, value={}] - skipped!".format(err, fielddef, addr, val),
@@ -5461,7 +5584,7 @@ def set_fieldvalue(fielddef, dobj, addr, value):
             value >>= bitsize
     else:
         try:
-            struct.pack_into(format_, dobj, addr, value)
+            get_struct(format_).pack_into(dobj, addr, value)
         except struct.error as err:
             log(ExitCode.RESTORE_DATA_ERROR,
                   "String type {} [fielddef={}, addr=0x{:04x}, value={} - skipped!".format(err, fielddef, addr, value),
@@ -5542,8 +5665,7 @@ def get_field(dobj, config_version, fieldname, fielddef, raw=False, addroffset=0
             value = get_field(dobj, config_version, name, format_[name], raw=raw, addroffset=addroffset, ignoregroup=ignoregroup, converter=converter)
             if value is not None:
                 mapping_value[name] = value
-        # copy complete returned mapping
-        valuemapping = copy.deepcopy(mapping_value)
+        valuemapping = mapping_value
 
     # a simple value
     elif isinstance(format_, (str, bool, int, float)):
@@ -5680,7 +5802,7 @@ def set_field(dobj, config_version, fieldname, fielddef, restoremapping, addroff
                 # bits
                 if bits != 0:
                     bitvalue = value
-                    value = struct.unpack_from(format_, dobj, baseaddr+addroffset)[0]
+                    value = get_struct(format_).unpack_from(dobj, baseaddr+addroffset)[0]
                     # validate restoremapping value
                     valid = validate_value(bitvalue, fielddef)
                     if not valid:
@@ -5735,7 +5857,7 @@ def set_field(dobj, config_version, fieldname, fielddef, restoremapping, addroff
             # handle indexed strings
             if strindex is not None:
                 # unpack index str from source baseaddr into str_
-                unpackedvalue = struct.unpack_from(format_, dobj, baseaddr)
+                unpackedvalue = get_struct(format_).unpack_from(dobj, baseaddr)
                 str_ = str(unpackedvalue[0], STR_CODING, errors='ignore')
                 # split into separate string values
                 sarray = str_.split('\x00')
@@ -5743,7 +5865,7 @@ def set_field(dobj, config_version, fieldname, fielddef, restoremapping, addroff
                 try:
                     set_max = get_strindex(hardware, 'SET_MAX')
                 except:     # pylint: disable=bare-except
-                    set_max = CONFIG['info']['template'][SETTINGVAR][HARDWARE.hstr(HARDWARE.ESP)].index('SET_MAX')
+                    set_max = CONFIG['info']['template'][SETTINGVAR][HSTR_ESP].index('SET_MAX')
                 if len(sarray) >= set_max:
                     delrange = len(sarray) - set_max
                     if delrange > 0:
@@ -6979,7 +7101,7 @@ if __name__ == "__main__":
                         get_versionstr(CONFIG['info']['version']),
                         HARDWARE.str(CONFIG['info']['hardware'])),
                         type_=LogType.INFO if ARGS.version is None else None)
-            SUPPORTED_VERSION = sorted(SETTINGS, key=lambda s: s[0], reverse=True)[0][0]
+            SUPPORTED_VERSION = SETTINGS_VERSIONS[-1]
             if CONFIG['info']['version'] > SUPPORTED_VERSION and not ARGS.ignorewarning:
                 try:
                     COLUMNS = os.get_terminal_size()[0]